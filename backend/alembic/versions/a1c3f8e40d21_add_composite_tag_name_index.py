@@ -0,0 +1,31 @@
+"""Add composite (user_id, name) index on tags for task tag filtering
+
+Revision ID: a1c3f8e40d21
+Revises: f7b245dcd29f
+Create Date: 2026-08-31 10:12:03.521904
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a1c3f8e40d21"
+down_revision: Union[str, Sequence[str], None] = "f7b245dcd29f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - Add composite tag lookup index."""
+    # The tag filter in GET /api/{user_id}/tasks resolves tag names scoped
+    # to one user (WHERE user_id = ... AND name IN (...)). A composite
+    # index serves that lookup without a second heap visit.
+    op.create_index("ix_tags_user_id_name", "tags", ["user_id", "name"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema - Remove composite tag lookup index."""
+    op.drop_index("ix_tags_user_id_name", table_name="tags")
@@ -0,0 +1,40 @@
+"""Add composite indexes for task list filtering and sorting
+
+Revision ID: b9d02e71c4f6
+Revises: a1c3f8e40d21
+Create Date: 2026-08-31 10:41:17.280466
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b9d02e71c4f6"
+down_revision: Union[str, Sequence[str], None] = "a1c3f8e40d21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - Add composite task list indexes."""
+    # GET /api/{user_id}/tasks always filters by user_id, optionally by
+    # status, and sorts by created_at / due_date / priority. These indexes
+    # turn filter + sort into a single index scan (no separate sort node).
+    op.create_index(
+        "ix_tasks_user_status_created",
+        "tasks",
+        ["user_id", "status", "created_at"],
+        unique=False,
+    )
+    op.create_index("ix_tasks_user_due_date", "tasks", ["user_id", "due_date"], unique=False)
+    op.create_index("ix_tasks_user_priority", "tasks", ["user_id", "priority"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema - Remove composite task list indexes."""
+    op.drop_index("ix_tasks_user_priority", table_name="tasks")
+    op.drop_index("ix_tasks_user_due_date", table_name="tasks")
+    op.drop_index("ix_tasks_user_status_created", table_name="tasks")
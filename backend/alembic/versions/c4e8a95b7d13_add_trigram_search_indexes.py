@@ -0,0 +1,41 @@
+"""Add pg_trgm GIN indexes so task search ILIKE can use an index
+
+Revision ID: c4e8a95b7d13
+Revises: b9d02e71c4f6
+Create Date: 2026-08-31 11:05:44.902317
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c4e8a95b7d13"
+down_revision: Union[str, Sequence[str], None] = "b9d02e71c4f6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - Add trigram indexes for title/description search."""
+    # The search filter uses leading-wildcard ILIKE ('%kw%'), which a btree
+    # index can never serve — every search was a sequential scan of the
+    # user's tasks. pg_trgm GIN indexes let Postgres answer the same ILIKE
+    # predicate from the index, so the endpoint code stays unchanged.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_tasks_title_trgm "
+        "ON tasks USING GIN (title gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_tasks_description_trgm "
+        "ON tasks USING GIN (description gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema - Remove trigram search indexes."""
+    op.execute("DROP INDEX IF EXISTS ix_tasks_description_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_tasks_title_trgm")
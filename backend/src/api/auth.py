@@ -5,11 +5,34 @@ This module provides JWT token verification for protected endpoints.
 CRITICAL: 100% test coverage required (Constitution Section VIII).
 """
 
+import hashlib
+import threading
+import time
+
 import jwt
 from fastapi import Header, HTTPException
 
 from .config import settings
 
+# Verified-token cache: a client hammering the API reuses the same token on
+# every request, so re-running HMAC verification + payload parsing each time
+# is repeated work. Cache token -> user_id for a short window, keyed by a
+# blake2b digest so raw tokens are never kept in memory. Entries expire at
+# the earlier of the cache TTL and the token's own exp claim.
+_TOKEN_CACHE: dict = {}
+_TOKEN_CACHE_LOCK = threading.Lock()
+_TOKEN_CACHE_MAX_SIZE = 10_000
+_TOKEN_CACHE_TTL_SECONDS = 60.0
+
+# Bound once at import: skips the jwt module attribute lookup per request,
+# and the algorithms list is not rebuilt per call
+_jwt_decode = jwt.decode
+_ALGORITHMS = ["HS256"]
+
+# PyJWT encodes a str key to bytes on every decode; hand it bytes up front
+# so the per-request encode disappears
+_SECRET_BYTES = settings.better_auth_secret.encode()
+
 
 async def get_current_user(authorization: str = Header(None)) -> str:
     """
@@ -52,18 +75,36 @@ async def get_current_user(authorization: str = Header(None)) -> str:
     if not authorization.startswith("Bearer "):
         raise HTTPException(status_code=401, detail="Invalid authentication token format")
 
-    # Step 3: Extract token
-    token = authorization.split(" ")[1]
+    # Step 3: Extract token (slice past "Bearer " — no intermediate list)
+    token = authorization[7:]
+
+    # Fast path: token verified recently and not yet expired
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    now = time.time()
+    with _TOKEN_CACHE_LOCK:
+        cached = _TOKEN_CACHE.get(cache_key)
+    if cached is not None and cached[0] > now:
+        return cached[1]  # type: ignore[no-any-return]
 
     try:
         # Step 4: Verify token signature and decode payload
-        payload = jwt.decode(token, settings.better_auth_secret, algorithms=["HS256"])
+        payload = _jwt_decode(token, _SECRET_BYTES, algorithms=_ALGORITHMS)
 
         # Step 5: Extract user_id from payload
         user_id = payload.get("user_id")
         if not user_id:
             raise HTTPException(status_code=401, detail="Invalid token payload: missing user_id")
 
+        # Cache the verified result; never cache beyond the token's exp claim
+        expires_at = now + _TOKEN_CACHE_TTL_SECONDS
+        token_exp = payload.get("exp")
+        if token_exp is not None:
+            expires_at = min(expires_at, float(token_exp))
+        with _TOKEN_CACHE_LOCK:
+            if len(_TOKEN_CACHE) >= _TOKEN_CACHE_MAX_SIZE:
+                _TOKEN_CACHE.clear()
+            _TOKEN_CACHE[cache_key] = (expires_at, user_id)
+
         return user_id  # type: ignore[no-any-return]
 
     except jwt.ExpiredSignatureError:
@@ -28,6 +28,20 @@ class Settings(BaseSettings):
     # Debug mode (show detailed errors in responses)
     debug: bool = True  # Temporarily True for debugging
 
+    # SQL statement logging (SQL_ECHO=true to log every query; keep off in
+    # production — per-statement formatting + I/O is pure overhead)
+    sql_echo: bool = False
+
+    # Connection liveness checking (DB_POOL_PRE_PING=true to re-enable the
+    # SELECT 1 probe per checkout; default relies on pool_recycle instead)
+    db_pool_pre_ping: bool = False
+
+    # Hot-row cache for single-task GETs (TASK_CACHE_ENABLED=true to enable).
+    # The cache is process-local and its write invalidation does not reach
+    # other uvicorn workers or replicas, so it is safe only when a single
+    # process serves all traffic; off by default.
+    task_cache_enabled: bool = False
+
     # Phase 3: OpenAI API key for Agents SDK
     openai_api_key: str = ""  # Optional for tests, required for production
 
@@ -11,14 +11,25 @@ from sqlmodel import Session, SQLModel, create_engine
 from .config import settings
 
 # Create database engine
-# echo=True enables SQL query logging (set to False in production)
+# SQL logging is driven by settings (SQL_ECHO env var) so it can never be
+# left enabled by accident in production
 # Use psycopg3 driver (modern PostgreSQL driver)
 database_url = settings.database_url.replace("postgresql://", "postgresql+psycopg://")
 
 engine = create_engine(
     database_url,
-    echo=False,  # Set to True to see SQL queries in logs
-    pool_pre_ping=True,  # Verify connections before using them
+    echo=settings.sql_echo,  # SQL_ECHO=true to see SQL queries in logs
+    # pre_ping costs a SELECT 1 round-trip on every checkout; instead recycle
+    # connections before Neon's ~300s idle timeout can kill them. The probe
+    # can be re-enabled for debugging via DB_POOL_PRE_PING=true.
+    pool_pre_ping=settings.db_pool_pre_ping,
+    pool_recycle=280,
+    # Grow the compiled-SQL cache well past the default so the handful of
+    # hot statements (task CRUD, tag filter subquery) never get recompiled
+    query_cache_size=1200,
+    # psycopg3: promote statements to server-side prepared after 5 runs,
+    # skipping the parse/plan round-trip on the hot path (Postgres only)
+    connect_args=({"prepare_threshold": 5} if database_url.startswith("postgresql") else {}),
 )
 
 
@@ -13,7 +13,7 @@ from typing import Callable
 
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from .config import settings
 from .db import create_tables, engine
@@ -80,17 +80,19 @@ app = FastAPI(
     docs_url="/docs",  # Swagger UI at /docs
     redoc_url="/redoc",  # ReDoc at /redoc
     lifespan=lifespan,  # Graceful shutdown handler
+    default_response_class=ORJSONResponse,  # orjson body encoding (faster than stdlib json)
 )
 
 # Configure CORS
-# Parse comma-separated frontend URLs
-frontend_origins = [url.strip() for url in settings.frontend_url.split(",")]
+# Parse comma-separated frontend URLs (deduplicated, order preserved)
+frontend_origins = list(dict.fromkeys(url.strip() for url in settings.frontend_url.split(",")))
 app.add_middleware(
     CORSMiddleware,
     allow_origins=frontend_origins,  # Allow multiple frontend origins
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
     allow_headers=["Authorization", "Content-Type"],
+    max_age=86400,  # Let browsers cache preflight responses for 24h
 )
 
 
@@ -9,6 +9,7 @@ from datetime import datetime
 from enum import Enum
 from typing import List, Optional
 
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -78,6 +79,17 @@ class Task(SQLModel, table=True):  # type: ignore[call-arg]
 
     __tablename__ = "tasks"
 
+    # Composite indexes matching the list endpoint's access patterns:
+    # every query filters by user_id, optionally by status, and sorts by
+    # created_at (default), due_date, or priority. Leading with user_id
+    # lets Postgres satisfy filter + sort from one index scan instead of
+    # an index lookup followed by a separate sort node.
+    __table_args__ = (
+        Index("ix_tasks_user_status_created", "user_id", "status", "created_at"),
+        Index("ix_tasks_user_due_date", "user_id", "due_date"),
+        Index("ix_tasks_user_priority", "user_id", "priority"),
+    )
+
     # Primary Key
     id: Optional[int] = Field(default=None, primary_key=True)
 
@@ -117,6 +129,11 @@ class Tag(SQLModel, table=True):  # type: ignore[call-arg]
 
     __tablename__ = "tags"
 
+    # Composite index: the task list tag filter resolves tag names for one
+    # user (WHERE user_id = ... AND name IN (...)), so index both together
+    # instead of relying on the single-column name index alone.
+    __table_args__ = (Index("ix_tags_user_id_name", "user_id", "name"),)
+
     # Primary Key
     id: Optional[int] = Field(default=None, primary_key=True)
 
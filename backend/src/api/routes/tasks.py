@@ -11,17 +11,114 @@ All endpoints must:
 3. Filter data by token user_id (NEVER by URL user_id)
 """
 
+import hashlib
+import threading
+import time
 from typing import List
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import delete, func, update
 from sqlmodel import Session, select, case
 
 from ..auth import get_current_user
+from ..config import settings
 from ..db import get_session
-from ..models import Task, TaskStatus, TaskPriority, TaskRecurrence
+from ..models import Task, TaskStatus, TaskPriority, TaskRecurrence, TaskTag
 
 router = APIRouter()
 
+# Column set returned by the list endpoint. Selecting plain columns instead
+# of full Task entities skips ORM identity-map and attribute-instrumentation
+# work per row, which dominates Python time for large task lists.
+_TASK_LIST_COLUMNS = (
+    Task.id,
+    Task.user_id,
+    Task.title,
+    Task.description,
+    Task.status,
+    Task.priority,
+    Task.due_date,
+    Task.completed_at,
+    Task.recurrence,
+    Task.last_completed_at,
+    Task.created_at,
+    Task.updated_at,
+)
+
+# Priority rank for sorting: HIGH (3) → MEDIUM (2) → LOW (1). The enum is
+# stored as text, so a plain ORDER BY would sort alphabetically (MEDIUM >
+# LOW > HIGH). Built once at import instead of per request.
+_PRIORITY_SORT_ORDER = case(
+    (Task.priority == TaskPriority.HIGH, 3),
+    (Task.priority == TaskPriority.MEDIUM, 2),
+    (Task.priority == TaskPriority.LOW, 1),
+    else_=0,
+)
+
+
+def _weak_etag(*parts) -> str:
+    """Build a weak ETag from a tuple of state markers (timestamps, counts)."""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=8).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _if_none_match_matches(header: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag.
+
+    Handles the "*" wildcard and comma-separated candidate lists, not just
+    an exact single-value match.
+    """
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return etag in (candidate.strip() for candidate in header.split(","))
+
+
+# Hot-row cache for the single-task GET. Clients that ping-pong between a
+# GET and a PATCH on the same task otherwise fetch the identical row twice
+# in quick succession. Entries are plain column dicts keyed by
+# (user_id, task_id); every write path for a task pops its key, and the
+# short TTL bounds staleness from writes outside this process.
+#
+# The cache is PROCESS-LOCAL: pops do not reach other uvicorn workers or
+# replicas, which would serve (and let clients revalidate) up-to-TTL-stale
+# rows after a write elsewhere. It is therefore opt-in via
+# TASK_CACHE_ENABLED and must stay off on multi-worker/multi-replica
+# deployments (helm-charts/, k8s/).
+_TASK_CACHE: dict = {}
+_TASK_CACHE_LOCK = threading.Lock()
+_TASK_CACHE_MAX_SIZE = 4096
+_TASK_CACHE_TTL_SECONDS = 2.0
+
+
+def _task_cache_get(user_id: str, task_id: int) -> dict | None:
+    if not settings.task_cache_enabled:
+        return None
+    with _TASK_CACHE_LOCK:
+        entry = _TASK_CACHE.get((user_id, task_id))
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+def _task_cache_put(user_id: str, task_id: int, row: dict) -> None:
+    if not settings.task_cache_enabled:
+        return
+    with _TASK_CACHE_LOCK:
+        if len(_TASK_CACHE) >= _TASK_CACHE_MAX_SIZE:
+            _TASK_CACHE.clear()
+        _TASK_CACHE[(user_id, task_id)] = (
+            time.monotonic() + _TASK_CACHE_TTL_SECONDS,
+            row,
+        )
+
+
+def _task_cache_pop(user_id: str, task_id: int) -> None:
+    with _TASK_CACHE_LOCK:
+        _TASK_CACHE.pop((user_id, task_id), None)
+
 
 # ============================================================================
 # Request/Response Models
@@ -57,8 +154,9 @@ class UpdateTaskRequest:
 
 
 @router.get("/api/{user_id}/tasks")
-async def list_tasks(
+def list_tasks(
     user_id: str,
+    request: Request,
     search: str | None = None,
     status: TaskStatus | None = None,
     priority: TaskPriority | None = None,
@@ -67,7 +165,7 @@ async def list_tasks(
     order: str = "asc",
     current_user: str = Depends(get_current_user),
     session: Session = Depends(get_session),
-) -> List[Task]:
+) -> Response:
     """
     List all tasks for the authenticated user.
 
@@ -88,8 +186,27 @@ async def list_tasks(
     if user_id != current_user:
         raise HTTPException(status_code=403, detail="Access denied")
 
+    # Cheap change fingerprint for the user's task set: any create, update,
+    # delete or toggle bumps MAX(updated_at) or COUNT(*), so a matching
+    # If-None-Match lets us answer 304 without building or serializing the
+    # full (possibly filtered) task list. Tag-filtered lists get no
+    # validator: their result set also depends on Tag/TaskTag state, and
+    # deleting a tag removes its associations without touching any task
+    # row, so the fingerprint below cannot see the change.
+    etag = None
+    if tags is None:
+        max_updated, task_count = session.execute(
+            select(func.max(Task.updated_at), func.count(Task.id)).where(
+                Task.user_id == current_user
+            )
+        ).one()
+        etag = _weak_etag(max_updated, task_count)
+        if _if_none_match_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers={"ETag": etag})
+
     # Build query (filter by token user_id)
-    statement = select(Task).where(Task.user_id == current_user)
+    # Columns-only select: rows come back as plain mappings, no ORM instances
+    statement = select(*_TASK_LIST_COLUMNS).where(Task.user_id == current_user)
 
     # Add search filter if provided (case-insensitive search in title and description)
     if search:
@@ -140,20 +257,12 @@ async def list_tasks(
                 statement = statement.order_by(Task.due_date.asc().nullslast())
 
         elif sort == "priority":
-            # Sort by priority: HIGH (3) → MEDIUM (2) → LOW (1)
-            # Use CASE to map priority strings to numeric values for proper sorting
-            # Default to descending (HIGH first) for better UX
-            priority_order = case(
-                (Task.priority == TaskPriority.HIGH, 3),
-                (Task.priority == TaskPriority.MEDIUM, 2),
-                (Task.priority == TaskPriority.LOW, 1),
-                else_=0,
-            )
+            # Sort by precomputed priority rank (see _PRIORITY_SORT_ORDER).
             # Use effective_order which defaults to "desc" for priority
             if effective_order == "asc":
-                statement = statement.order_by(priority_order.asc())
+                statement = statement.order_by(_PRIORITY_SORT_ORDER.asc())
             else:
-                statement = statement.order_by(priority_order.desc())
+                statement = statement.order_by(_PRIORITY_SORT_ORDER.desc())
 
         elif sort == "created_at":
             if order == "desc":
@@ -167,9 +276,12 @@ async def list_tasks(
             else:
                 statement = statement.order_by(Task.title.asc())
 
-    tasks = session.exec(statement).all()
+    rows = session.execute(statement).mappings().all()
 
-    return list(tasks)
+    # Returning a Response directly bypasses FastAPI's jsonable_encoder pass
+    # over every row; orjson serializes datetimes and None natively.
+    headers = {"ETag": etag} if etag is not None else None
+    return ORJSONResponse([dict(row) for row in rows], headers=headers)
 
 
 # ============================================================================
@@ -178,12 +290,14 @@ async def list_tasks(
 
 
 @router.get("/api/{user_id}/tasks/{task_id}")
-async def get_task(
+def get_task(
     user_id: str,
     task_id: int,
+    request: Request,
+    response: Response,
     current_user: str = Depends(get_current_user),
     session: Session = Depends(get_session),
-) -> Task:
+) -> dict:
     """
     Get a single task by ID.
 
@@ -196,14 +310,28 @@ async def get_task(
     if user_id != current_user:
         raise HTTPException(status_code=403, detail="Access denied")
 
-    # Fetch task
-    statement = select(Task).where(Task.id == task_id, Task.user_id == current_user)
-    task = session.exec(statement).first()
+    # Hot-row cache first; on a miss fetch plain columns (no ORM instance)
+    # and populate for the next read
+    row = _task_cache_get(current_user, task_id)
+    if row is None:
+        statement = select(*_TASK_LIST_COLUMNS).where(
+            Task.id == task_id, Task.user_id == current_user
+        )
+        mapping = session.execute(statement).mappings().first()
 
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
+        if mapping is None:
+            raise HTTPException(status_code=404, detail="Task not found")
 
-    return task
+        row = dict(mapping)
+        _task_cache_put(current_user, task_id, row)
+
+    # Conditional GET: the ETag tracks updated_at, which every write bumps
+    etag = _weak_etag(row["updated_at"])
+    if _if_none_match_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    return row
 
 
 # ============================================================================
@@ -212,7 +340,7 @@ async def get_task(
 
 
 @router.post("/api/{user_id}/tasks", status_code=201)
-async def create_task(
+def create_task(
     user_id: str,
     request: dict,
     current_user: str = Depends(get_current_user),
@@ -244,7 +372,8 @@ async def create_task(
                 status_code=400, detail="Invalid due_date format. Use ISO 8601 format."
             )
 
-    # Create task
+    # Create task (single timestamp read per request)
+    now = datetime.utcnow()
     task = Task(
         user_id=current_user,  # CRITICAL: Use token user_id
         title=request["title"],
@@ -253,13 +382,14 @@ async def create_task(
         due_date=due_date,
         recurrence=request.get("recurrence", TaskRecurrence.NONE),
         status=TaskStatus.INCOMPLETE,
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
+        created_at=now,
+        updated_at=now,
     )
 
     session.add(task)
     session.commit()
     session.refresh(task)
+    _task_cache_pop(current_user, task.id)
 
     return task
 
@@ -270,13 +400,13 @@ async def create_task(
 
 
 @router.put("/api/{user_id}/tasks/{task_id}")
-async def update_task(
+def update_task(
     user_id: str,
     task_id: int,
     request: dict,
     current_user: str = Depends(get_current_user),
     session: Session = Depends(get_session),
-) -> Task:
+) -> dict:
     """
     Update an existing task.
 
@@ -289,45 +419,53 @@ async def update_task(
     if user_id != current_user:
         raise HTTPException(status_code=403, detail="Access denied")
 
-    # Fetch task
-    statement = select(Task).where(Task.id == task_id, Task.user_id == current_user)
-    task = session.exec(statement).first()
-
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
-
-    # Update fields
+    # Build the new column values from the request. Every field here is
+    # derived from the request alone, so the update does not need to load
+    # the current row first — ownership is enforced in the WHERE clause.
+    now = datetime.utcnow()
+    values: dict = {"updated_at": now}
     if "title" in request:
-        task.title = request["title"]
+        values["title"] = request["title"]
     if "description" in request:
-        task.description = request["description"]
+        values["description"] = request["description"]
     if "status" in request:
-        task.status = request["status"]
+        values["status"] = request["status"]
         if request["status"] == TaskStatus.COMPLETE:
-            task.last_completed_at = datetime.utcnow()
+            values["last_completed_at"] = now
     if "priority" in request:
-        task.priority = request["priority"]
+        values["priority"] = request["priority"]
     if "due_date" in request:
         # Parse due_date if present (convert ISO string to datetime)
         if request["due_date"]:
             try:
-                task.due_date = datetime.fromisoformat(request["due_date"].replace("Z", "+00:00"))
+                values["due_date"] = datetime.fromisoformat(
+                    request["due_date"].replace("Z", "+00:00")
+                )
             except (ValueError, AttributeError):
                 raise HTTPException(
                     status_code=400, detail="Invalid due_date format. Use ISO 8601 format."
                 )
         else:
-            task.due_date = None
+            values["due_date"] = None
     if "recurrence" in request:
-        task.recurrence = request["recurrence"]
-
-    task.updated_at = datetime.utcnow()
-
-    session.add(task)
+        values["recurrence"] = request["recurrence"]
+
+    # Single round-trip: UPDATE ... WHERE id AND user_id ... RETURNING.
+    # A miss (no such task, or another user's task) returns no row -> 404.
+    statement = (
+        update(Task)
+        .where(Task.id == task_id, Task.user_id == current_user)
+        .values(**values)
+        .returning(*_TASK_LIST_COLUMNS)
+    )
+    row = session.execute(statement).mappings().first()
     session.commit()
-    session.refresh(task)
+    _task_cache_pop(current_user, task_id)
 
-    return task
+    if row is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    return dict(row)
 
 
 # ============================================================================
@@ -336,7 +474,7 @@ async def update_task(
 
 
 @router.delete("/api/{user_id}/tasks/{task_id}")
-async def delete_task(
+def delete_task(
     user_id: str,
     task_id: int,
     current_user: str = Depends(get_current_user),
@@ -354,17 +492,19 @@ async def delete_task(
     if user_id != current_user:
         raise HTTPException(status_code=403, detail="Access denied")
 
-    # Fetch task
-    statement = select(Task).where(Task.id == task_id, Task.user_id == current_user)
-    task = session.exec(statement).first()
+    # Bulk delete: no SELECT, no ORM hydration. Ownership is enforced in
+    # the WHERE clause. The tag join rows are removed first (the ORM-level
+    # delete-orphan cascade does not apply to bulk deletes), scoped by the
+    # same ownership subquery so another user's task is never touched.
+    owned_task = select(Task.id).where(Task.id == task_id, Task.user_id == current_user)
+    session.execute(delete(TaskTag).where(TaskTag.task_id.in_(owned_task)))
+    result = session.execute(delete(Task).where(Task.id == task_id, Task.user_id == current_user))
+    session.commit()
+    _task_cache_pop(current_user, task_id)
 
-    if not task:
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="Task not found")
 
-    # Delete task
-    session.delete(task)
-    session.commit()
-
     return {"message": "Task deleted successfully"}
 
 
@@ -374,7 +514,7 @@ async def delete_task(
 
 
 @router.patch("/api/{user_id}/tasks/{task_id}/status")
-async def toggle_task_status(
+def toggle_task_status(
     user_id: str,
     task_id: int,
     request: dict,
@@ -404,18 +544,21 @@ async def toggle_task_status(
     if "status" not in request:
         raise HTTPException(status_code=400, detail="Status is required")
 
+    # Single timestamp read per request
+    now = datetime.utcnow()
+
     task.status = request["status"]
 
     # Set or clear completed_at based on status
     if request["status"] == TaskStatus.COMPLETE:
-        task.completed_at = datetime.utcnow()
+        task.completed_at = now
 
         # Handle recurring tasks
         if task.recurrence != TaskRecurrence.NONE:
             from datetime import timedelta
 
             # Save completion time
-            task.last_completed_at = datetime.utcnow()
+            task.last_completed_at = now
 
             # Calculate next due_date based on recurrence type
             if task.due_date:
@@ -434,11 +577,12 @@ async def toggle_task_status(
     else:
         task.completed_at = None
 
-    task.updated_at = datetime.utcnow()
+    task.updated_at = now
 
     session.add(task)
     session.commit()
     session.refresh(task)
+    _task_cache_pop(current_user, task.id)
 
     return task
 
@@ -449,7 +593,7 @@ async def toggle_task_status(
 
 
 @router.patch("/api/{user_id}/tasks/{task_id}/complete")
-async def mark_task_complete(
+def mark_task_complete(
     user_id: str,
     task_id: int,
     current_user: str = Depends(get_current_user),
@@ -481,17 +625,18 @@ async def mark_task_complete(
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
 
-    # Toggle completion status
+    # Toggle completion status (single timestamp read per request)
+    now = datetime.utcnow()
     if task.status == TaskStatus.INCOMPLETE:
         task.status = TaskStatus.COMPLETE
-        task.completed_at = datetime.utcnow()
+        task.completed_at = now
 
         # Handle recurring tasks
         if task.recurrence != TaskRecurrence.NONE:
             from datetime import timedelta
 
             # Save completion time
-            task.last_completed_at = datetime.utcnow()
+            task.last_completed_at = now
 
             # Calculate next due_date based on recurrence type
             if task.due_date:
@@ -512,10 +657,11 @@ async def mark_task_complete(
         task.status = TaskStatus.INCOMPLETE
         task.completed_at = None
 
-    task.updated_at = datetime.utcnow()
+    task.updated_at = now
 
     session.add(task)
     session.commit()
     session.refresh(task)
+    _task_cache_pop(current_user, task.id)
 
     return task
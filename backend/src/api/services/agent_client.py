@@ -98,6 +98,16 @@ class AgentClient:
         # Register MCP tools
         self.tools = self._register_tools()
 
+        # Dispatch table for tool execution: one dict lookup instead of
+        # walking an if/elif chain for every tool call
+        self._tool_handlers = {
+            "add_task": self._run_add_task,
+            "list_tasks": self._run_list_tasks,
+            "complete_task": self._run_complete_task,
+            "update_task": self._run_update_task,
+            "delete_task": self._run_delete_task,
+        }
+
         logger.info(
             event="agent_client_initialized",
             message=f"AgentClient initialized with {len(self.tools)} tools and CircuitBreaker",
@@ -453,177 +463,191 @@ class AgentClient:
         Raises:
             Exception: If tool execution fails
         """
+        handler = self._tool_handlers.get(function_name)
+        if handler is None:
+            # Tool not implemented yet
+            logger.warning(
+                event="tool_not_implemented",
+                message=f"Tool not implemented: {function_name}",
+                user_id=user_id,
+                tool_name=function_name,
+            )
+            return {
+                "success": False,
+                "error": f"Tool '{function_name}' not yet implemented",
+            }
+
         try:
-            if function_name == "add_task":
-                # Parse and validate input
-                task_input = AddTaskInput(
-                    title=function_args.get("title"),
-                    description=function_args.get("description"),
-                    priority=TaskPriority(function_args.get("priority", "MEDIUM")),
-                    due_date=function_args.get("due_date"),
-                    tags=function_args.get("tags"),
-                )
+            return handler(session, user_id, function_args)
 
-                # Execute tool with INJECTED user_id
-                result = add_task(
-                    session=session,
-                    user_id=user_id,  # CRITICAL: Injected by server
-                    task_input=task_input,
-                )
+        except Exception as e:
+            logger.error(
+                event="tool_execution_failed",
+                message=f"Tool execution failed: {function_name}",
+                user_id=user_id,
+                tool_name=function_name,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return {"success": False, "error": str(e)}
 
-                # Convert to serializable dict
-                return {
-                    "success": True,
-                    "task_id": result.id,
-                    "title": result.title,
-                    "priority": result.priority.value,
-                    "status": result.status.value,
-                    "tags": result.tags,
-                }
-
-            elif function_name == "list_tasks":
-                # Parse and validate input
-                task_input = ListTasksInput(
-                    status=(
-                        TaskStatus(function_args["status"])
-                        if function_args.get("status")
-                        else None
-                    ),
-                    priority=(
-                        TaskPriority(function_args["priority"])
-                        if function_args.get("priority")
-                        else None
-                    ),
-                    tag=function_args.get("tag"),
-                    limit=function_args.get("limit", 50),
-                )
+    def _run_add_task(
+        self, session: Session, user_id: str, function_args: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Execute the add_task MCP tool."""
+        # Parse and validate input
+        task_input = AddTaskInput(
+            title=function_args.get("title"),
+            description=function_args.get("description"),
+            priority=TaskPriority(function_args.get("priority", "MEDIUM")),
+            due_date=function_args.get("due_date"),
+            tags=function_args.get("tags"),
+        )
 
-                # Execute tool with INJECTED user_id
-                result = list_tasks(
-                    session=session,
-                    user_id=user_id,  # CRITICAL: Injected by server
-                    task_input=task_input,
-                )
+        # Execute tool with INJECTED user_id
+        result = add_task(
+            session=session,
+            user_id=user_id,  # CRITICAL: Injected by server
+            task_input=task_input,
+        )
 
-                # Convert to serializable dict
-                tasks_data = [
-                    {
-                        "id": task.id,
-                        "title": task.title,
-                        "description": task.description,
-                        "priority": task.priority.value,
-                        "status": task.status.value,
-                        "due_date": task.due_date.isoformat()
-                        if task.due_date
-                        else None,
-                        "tags": task.tags,
-                        "created_at": task.created_at.isoformat(),
-                    }
-                    for task in result.tasks
-                ]
+        # Convert to serializable dict
+        return {
+            "success": True,
+            "task_id": result.id,
+            "title": result.title,
+            "priority": result.priority.value,
+            "status": result.status.value,
+            "tags": result.tags,
+        }
 
-                return {"success": True, "tasks": tasks_data, "count": result.count}
+    def _run_list_tasks(
+        self, session: Session, user_id: str, function_args: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Execute the list_tasks MCP tool."""
+        # Parse and validate input
+        task_input = ListTasksInput(
+            status=(
+                TaskStatus(function_args["status"])
+                if function_args.get("status")
+                else None
+            ),
+            priority=(
+                TaskPriority(function_args["priority"])
+                if function_args.get("priority")
+                else None
+            ),
+            tag=function_args.get("tag"),
+            limit=function_args.get("limit", 50),
+        )
 
-            elif function_name == "complete_task":
-                # Parse and validate input
-                task_input = CompleteTaskInput(task_id=function_args["task_id"])
+        # Execute tool with INJECTED user_id
+        result = list_tasks(
+            session=session,
+            user_id=user_id,  # CRITICAL: Injected by server
+            task_input=task_input,
+        )
 
-                # Execute tool with INJECTED user_id
-                result = complete_task(
-                    session=session,
-                    user_id=user_id,  # CRITICAL: Injected by server
-                    task_input=task_input,
-                )
+        # Convert to serializable dict
+        tasks_data = [
+            {
+                "id": task.id,
+                "title": task.title,
+                "description": task.description,
+                "priority": task.priority.value,
+                "status": task.status.value,
+                "due_date": task.due_date.isoformat() if task.due_date else None,
+                "tags": task.tags,
+                "created_at": task.created_at.isoformat(),
+            }
+            for task in result.tasks
+        ]
 
-                # Convert to serializable dict
-                return {
-                    "success": True,
-                    "task_id": result.id,
-                    "title": result.title,
-                    "status": result.status.value,
-                    "completed_at": (
-                        result.completed_at.isoformat() if result.completed_at else None
-                    ),
-                    "message": result.message,
-                }
-
-            elif function_name == "update_task":
-                # Parse and validate input
-                task_input = UpdateTaskInput(
-                    task_id=function_args["task_id"],
-                    title=function_args.get("title"),
-                    description=function_args.get("description"),
-                    priority=(
-                        TaskPriority(function_args["priority"])
-                        if function_args.get("priority")
-                        else None
-                    ),
-                    due_date=function_args.get("due_date"),
-                    tags=function_args.get("tags"),
-                )
+        return {"success": True, "tasks": tasks_data, "count": result.count}
 
-                # Execute tool with INJECTED user_id
-                result = update_task(
-                    session=session,
-                    user_id=user_id,  # CRITICAL: Injected by server
-                    task_input=task_input,
-                )
+    def _run_complete_task(
+        self, session: Session, user_id: str, function_args: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Execute the complete_task MCP tool."""
+        # Parse and validate input
+        task_input = CompleteTaskInput(task_id=function_args["task_id"])
+
+        # Execute tool with INJECTED user_id
+        result = complete_task(
+            session=session,
+            user_id=user_id,  # CRITICAL: Injected by server
+            task_input=task_input,
+        )
 
-                # Convert to serializable dict
-                return {
-                    "success": True,
-                    "task_id": result.id,
-                    "title": result.title,
-                    "description": result.description,
-                    "priority": result.priority.value,
-                    "status": result.status.value,
-                    "due_date": result.due_date.isoformat()
-                    if result.due_date
-                    else None,
-                    "tags": result.tags,
-                    "updated_at": result.updated_at.isoformat(),
-                    "message": result.message,
-                }
-
-            elif function_name == "delete_task":
-                # Parse and validate input
-                task_input = DeleteTaskInput(task_id=function_args["task_id"])
-
-                # Execute tool with INJECTED user_id
-                result = delete_task(
-                    session=session,
-                    user_id=user_id,  # CRITICAL: Injected by server
-                    task_input=task_input,
-                )
+        # Convert to serializable dict
+        return {
+            "success": True,
+            "task_id": result.id,
+            "title": result.title,
+            "status": result.status.value,
+            "completed_at": (
+                result.completed_at.isoformat() if result.completed_at else None
+            ),
+            "message": result.message,
+        }
 
-                # Convert to serializable dict
-                return {
-                    "success": True,
-                    "task_id": result.task_id,
-                    "title": result.title,
-                    "message": result.message,
-                }
+    def _run_update_task(
+        self, session: Session, user_id: str, function_args: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Execute the update_task MCP tool."""
+        # Parse and validate input
+        task_input = UpdateTaskInput(
+            task_id=function_args["task_id"],
+            title=function_args.get("title"),
+            description=function_args.get("description"),
+            priority=(
+                TaskPriority(function_args["priority"])
+                if function_args.get("priority")
+                else None
+            ),
+            due_date=function_args.get("due_date"),
+            tags=function_args.get("tags"),
+        )
 
-            else:
-                # Tool not implemented yet
-                logger.warning(
-                    event="tool_not_implemented",
-                    message=f"Tool not implemented: {function_name}",
-                    user_id=user_id,
-                    tool_name=function_name,
-                )
-                return {
-                    "success": False,
-                    "error": f"Tool '{function_name}' not yet implemented",
-                }
+        # Execute tool with INJECTED user_id
+        result = update_task(
+            session=session,
+            user_id=user_id,  # CRITICAL: Injected by server
+            task_input=task_input,
+        )
 
-        except Exception as e:
-            logger.error(
-                event="tool_execution_failed",
-                message=f"Tool execution failed: {function_name}",
-                user_id=user_id,
-                tool_name=function_name,
-                error=str(e),
-                error_type=type(e).__name__,
-            )
-            return {"success": False, "error": str(e)}
+        # Convert to serializable dict
+        return {
+            "success": True,
+            "task_id": result.id,
+            "title": result.title,
+            "description": result.description,
+            "priority": result.priority.value,
+            "status": result.status.value,
+            "due_date": result.due_date.isoformat() if result.due_date else None,
+            "tags": result.tags,
+            "updated_at": result.updated_at.isoformat(),
+            "message": result.message,
+        }
+
+    def _run_delete_task(
+        self, session: Session, user_id: str, function_args: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Execute the delete_task MCP tool."""
+        # Parse and validate input
+        task_input = DeleteTaskInput(task_id=function_args["task_id"])
+
+        # Execute tool with INJECTED user_id
+        result = delete_task(
+            session=session,
+            user_id=user_id,  # CRITICAL: Injected by server
+            task_input=task_input,
+        )
+
+        # Convert to serializable dict
+        return {
+            "success": True,
+            "task_id": result.task_id,
+            "title": result.title,
+            "message": result.message,
+        }
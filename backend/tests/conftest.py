@@ -176,10 +176,15 @@ def override_get_session(test_db_session: Session):
     """
     from src.api.db import get_session
     from src.api.main import app
+    from src.api.routes.tasks import _TASK_CACHE
 
     def get_test_session():
         yield test_db_session
 
+    # Each test gets a fresh database where task ids restart at 1, so the
+    # process-level hot-row cache must not carry entries across tests
+    _TASK_CACHE.clear()
+
     app.dependency_overrides[get_session] = get_test_session
     yield
     app.dependency_overrides.clear()
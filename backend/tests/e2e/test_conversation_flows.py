@@ -27,6 +27,9 @@ from sqlmodel import Session, select
 
 from src.api.models import Task, Conversation, Message, MessageRole, TaskPriority, TaskStatus
 
+# Opt out of these during fast local runs with: pytest -m "not slow"
+pytestmark = pytest.mark.slow
+
 
 # ============================================================================
 # T099: Full Create → List → Complete → Delete Flow
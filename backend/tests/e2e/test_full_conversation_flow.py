@@ -29,6 +29,9 @@ from sqlmodel import Session, select
 
 from src.api.models import Task, Conversation, Message, MessageRole, TaskPriority, TaskStatus
 
+# Opt out of these during fast local runs with: pytest -m "not slow"
+pytestmark = pytest.mark.slow
+
 
 # ============================================================================
 # E2E Conversation Flow Tests (T032)
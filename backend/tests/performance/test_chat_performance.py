@@ -39,6 +39,9 @@ from unittest.mock import patch, MagicMock
 
 from httpx import AsyncClient
 
+# Opt out of these during fast local runs with: pytest -m "not slow"
+pytestmark = pytest.mark.slow
+
 
 def calculate_percentile(data: List[float], percentile: float) -> float:
     """
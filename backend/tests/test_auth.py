@@ -271,3 +271,81 @@ async def test_token_with_extra_spaces_raises_401(test_jwt_token: str):
         await get_current_user(authorization=authorization_header)
 
     assert exc_info.value.status_code == 401
+
+
+# ============================================================================
+# Verified-token cache
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_cached_token_returns_user_id_without_redecoding(test_jwt_token: str, monkeypatch):
+    """
+    Test that a repeated token is served from the verified-token cache.
+
+    Given: A token that has already been verified once
+    When: get_current_user is called again with the same token
+    Then: Returns the same user_id without re-running JWT verification
+    """
+    from src.api import auth
+
+    # Arrange: start from an empty cache, verify once to populate it
+    auth._TOKEN_CACHE.clear()
+    authorization_header = f"Bearer {test_jwt_token}"
+    first = await auth.get_current_user(authorization=authorization_header)
+    assert first == "test_user_123"
+
+    # If the second call reaches JWT verification, the cache missed
+    def fail_decode(*args, **kwargs):
+        raise AssertionError("cache hit must not re-run JWT verification")
+
+    monkeypatch.setattr(auth, "_jwt_decode", fail_decode)
+
+    # Act
+    second = await auth.get_current_user(authorization=authorization_header)
+
+    # Assert
+    assert second == "test_user_123"
+
+
+@pytest.mark.asyncio
+async def test_cached_token_expires_at_token_exp_not_cache_ttl():
+    """
+    Test that a cache entry never outlives the token's own exp claim.
+
+    Given: A token whose exp falls well inside the 60s cache TTL
+    When: The token is verified (cached), exp passes, and it is presented again
+    Then: Raises HTTPException 401 — the cache must not keep an expired
+          token alive for the remainder of its TTL
+    """
+    import time
+    from datetime import datetime, timedelta
+
+    import jwt
+
+    from src.api import auth
+    from src.api.config import settings
+
+    # Arrange: a token expiring in ~1 second
+    auth._TOKEN_CACHE.clear()
+    payload = {
+        "user_id": "test_user_123",
+        "email": "test@example.com",
+        "exp": datetime.utcnow() + timedelta(seconds=1),
+        "iat": datetime.utcnow(),
+    }
+    token = jwt.encode(payload, settings.better_auth_secret, algorithm="HS256")
+    authorization_header = f"Bearer {token}"
+
+    # Valid (and cached) while exp has not passed
+    assert await auth.get_current_user(authorization=authorization_header) == "test_user_123"
+
+    # Act: let the token's own exp pass, well inside the cache TTL
+    time.sleep(1.2)
+
+    # Assert: rejected despite the recent cache entry
+    with pytest.raises(HTTPException) as exc_info:
+        await auth.get_current_user(authorization=authorization_header)
+
+    assert exc_info.value.status_code == 401
+    assert "expired" in exc_info.value.detail.lower()
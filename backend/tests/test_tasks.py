@@ -1957,3 +1957,297 @@ async def test_stop_recurrence(
         completed_task["due_date"] == original_due_date
     ), "Due date should not change for non-recurring task"
     assert completed_task["recurrence"] == "NONE"
+
+
+# ============================================================================
+# Hot-row cache for single-task GETs (TASK_CACHE_ENABLED)
+# ============================================================================
+
+
+@pytest.fixture
+def enable_task_cache(monkeypatch):
+    """Turn on the opt-in hot-row cache for the duration of one test."""
+    from src.api.config import settings
+
+    monkeypatch.setattr(settings, "task_cache_enabled", True)
+
+
+@pytest.mark.asyncio
+async def test_get_task_does_not_populate_cache_by_default(
+    client: AsyncClient,
+    test_jwt_token: str,
+):
+    """
+    The hot-row cache is process-local, so it must stay off unless
+    TASK_CACHE_ENABLED is set: a GET with the default settings leaves the
+    cache empty.
+    """
+    from src.api.routes.tasks import _TASK_CACHE
+
+    create_response = await client.post(
+        "/api/test_user_123/tasks",
+        headers={"Authorization": f"Bearer {test_jwt_token}"},
+        json={"title": "Uncached task"},
+    )
+    assert create_response.status_code == 201
+    task_id = create_response.json()["id"]
+
+    get_response = await client.get(
+        f"/api/test_user_123/tasks/{task_id}",
+        headers={"Authorization": f"Bearer {test_jwt_token}"},
+    )
+
+    assert get_response.status_code == 200
+    assert _TASK_CACHE == {}, "Cache must not be populated when TASK_CACHE_ENABLED is off"
+
+
+@pytest.mark.asyncio
+async def test_get_task_populates_cache_when_enabled(
+    client: AsyncClient,
+    test_jwt_token: str,
+    enable_task_cache,
+):
+    """With the cache enabled, a GET stores the row keyed (user_id, task_id)."""
+    from src.api.routes.tasks import _TASK_CACHE
+
+    create_response = await client.post(
+        "/api/test_user_123/tasks",
+        headers={"Authorization": f"Bearer {test_jwt_token}"},
+        json={"title": "Cached task"},
+    )
+    assert create_response.status_code == 201
+    task_id = create_response.json()["id"]
+
+    get_response = await client.get(
+        f"/api/test_user_123/tasks/{task_id}",
+        headers={"Authorization": f"Bearer {test_jwt_token}"},
+    )
+
+    assert get_response.status_code == 200
+    assert ("test_user_123", task_id) in _TASK_CACHE
+    assert _TASK_CACHE[("test_user_123", task_id)][1]["title"] == "Cached task"
+
+
+@pytest.mark.asyncio
+async def test_update_invalidates_cached_task(
+    client: AsyncClient,
+    test_jwt_token: str,
+    enable_task_cache,
+):
+    """
+    A PUT must pop the cached row so the next GET serves the new data
+    instead of a stale cache entry.
+    """
+    from src.api.routes.tasks import _TASK_CACHE
+
+    create_response = await client.post(
+        "/api/test_user_123/tasks",
+        headers={"Authorization": f"Bearer {test_jwt_token}"},
+        json={"title": "Original title"},
+    )
+    assert create_response.status_code == 201
+    task_id = create_response.json()["id"]
+
+    # Populate the cache
+    get_response = await client.get(
+        f"/api/test_user_123/tasks/{task_id}",
+        headers={"Authorization": f"Bearer {test_jwt_token}"},
+    )
+    assert get_response.status_code == 200
+    assert ("test_user_123", task_id) in _TASK_CACHE
+
+    # Write path pops the key...
+    update_response = await client.put(
+        f"/api/test_user_123/tasks/{task_id}",
+        headers={"Authorization": f"Bearer {test_jwt_token}"},
+        json={"title": "Updated title"},
+    )
+    assert update_response.status_code == 200
+    assert ("test_user_123", task_id) not in _TASK_CACHE
+
+    # ...so the next GET reflects the update (and repopulates)
+    refetch_response = await client.get(
+        f"/api/test_user_123/tasks/{task_id}",
+        headers={"Authorization": f"Bearer {test_jwt_token}"},
+    )
+    assert refetch_response.status_code == 200
+    assert refetch_response.json()["title"] == "Updated title"
+    assert _TASK_CACHE[("test_user_123", task_id)][1]["title"] == "Updated title"
+
+
+@pytest.mark.asyncio
+async def test_delete_invalidates_cached_task(
+    client: AsyncClient,
+    test_jwt_token: str,
+    enable_task_cache,
+):
+    """A DELETE must pop the cached row; the next GET is a genuine 404."""
+    from src.api.routes.tasks import _TASK_CACHE
+
+    create_response = await client.post(
+        "/api/test_user_123/tasks",
+        headers={"Authorization": f"Bearer {test_jwt_token}"},
+        json={"title": "Doomed task"},
+    )
+    assert create_response.status_code == 201
+    task_id = create_response.json()["id"]
+
+    get_response = await client.get(
+        f"/api/test_user_123/tasks/{task_id}",
+        headers={"Authorization": f"Bearer {test_jwt_token}"},
+    )
+    assert get_response.status_code == 200
+    assert ("test_user_123", task_id) in _TASK_CACHE
+
+    delete_response = await client.delete(
+        f"/api/test_user_123/tasks/{task_id}",
+        headers={"Authorization": f"Bearer {test_jwt_token}"},
+    )
+    assert delete_response.status_code == 200
+    assert ("test_user_123", task_id) not in _TASK_CACHE
+
+    refetch_response = await client.get(
+        f"/api/test_user_123/tasks/{task_id}",
+        headers={"Authorization": f"Bearer {test_jwt_token}"},
+    )
+    assert refetch_response.status_code == 404
+
+
+# ============================================================================
+# Conditional GET (ETag / If-None-Match) on task read endpoints
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_list_tasks_etag_revalidation_cycle(
+    client: AsyncClient,
+    test_jwt_token: str,
+):
+    """
+    Full conditional-GET cycle on the list endpoint:
+    200 with an ETag, 304 on revalidation, then 200 with a new ETag after
+    a write changes the task set.
+    """
+    headers = {"Authorization": f"Bearer {test_jwt_token}"}
+
+    first = await client.get("/api/test_user_123/tasks", headers=headers)
+    assert first.status_code == 200
+    etag = first.headers.get("etag")
+    assert etag is not None, "List responses must carry an ETag"
+
+    revalidate = await client.get(
+        "/api/test_user_123/tasks",
+        headers={**headers, "If-None-Match": etag},
+    )
+    assert revalidate.status_code == 304
+    assert revalidate.headers.get("etag") == etag
+
+    create_response = await client.post(
+        "/api/test_user_123/tasks",
+        headers=headers,
+        json={"title": "Invalidates the list ETag"},
+    )
+    assert create_response.status_code == 201
+
+    after_write = await client.get(
+        "/api/test_user_123/tasks",
+        headers={**headers, "If-None-Match": etag},
+    )
+    assert after_write.status_code == 200, "Stale ETag must not revalidate after a write"
+    assert after_write.headers.get("etag") != etag
+    assert len(after_write.json()) == 1
+
+
+@pytest.mark.asyncio
+async def test_tag_filtered_list_has_no_etag(
+    client: AsyncClient,
+    test_jwt_token: str,
+    test_user,
+    test_db_session: Session,
+):
+    """
+    Tag-filtered lists must not carry a validator: deleting a tag removes
+    its TaskTag associations without touching any task row, so the
+    task-row fingerprint cannot see the change and a 304 would leave
+    clients rendering a stale list.
+    """
+    headers = {"Authorization": f"Bearer {test_jwt_token}"}
+
+    task = Task(
+        user_id="test_user_123",
+        title="Tagged task",
+        status=TaskStatus.INCOMPLETE,
+        priority=TaskPriority.MEDIUM,
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow(),
+    )
+    tag = Tag(user_id="test_user_123", name="work", created_at=datetime.utcnow())
+    test_db_session.add_all([task, tag])
+    test_db_session.commit()
+    test_db_session.add(TaskTag(task_id=task.id, tag_id=tag.id))
+    test_db_session.commit()
+
+    filtered = await client.get("/api/test_user_123/tasks?tags=work", headers=headers)
+    assert filtered.status_code == 200
+    assert len(filtered.json()) == 1
+    assert "etag" not in filtered.headers
+
+    # Delete the tag: associations vanish, but no task row changes
+    test_db_session.delete(test_db_session.get(TaskTag, (task.id, tag.id)))
+    test_db_session.delete(tag)
+    test_db_session.commit()
+
+    # Even a wildcard revalidation must be served in full, never a 304
+    after_delete = await client.get(
+        "/api/test_user_123/tasks?tags=work",
+        headers={**headers, "If-None-Match": "*"},
+    )
+    assert after_delete.status_code == 200
+    assert after_delete.json() == []
+
+
+@pytest.mark.asyncio
+async def test_get_task_etag_revalidation_cycle(
+    client: AsyncClient,
+    test_jwt_token: str,
+):
+    """
+    Full conditional-GET cycle on the single-task endpoint, including a
+    comma-separated If-None-Match candidate list.
+    """
+    headers = {"Authorization": f"Bearer {test_jwt_token}"}
+
+    create_response = await client.post(
+        "/api/test_user_123/tasks",
+        headers=headers,
+        json={"title": "Revalidated task"},
+    )
+    assert create_response.status_code == 201
+    task_id = create_response.json()["id"]
+
+    first = await client.get(f"/api/test_user_123/tasks/{task_id}", headers=headers)
+    assert first.status_code == 200
+    etag = first.headers.get("etag")
+    assert etag is not None, "Single-task responses must carry an ETag"
+
+    revalidate = await client.get(
+        f"/api/test_user_123/tasks/{task_id}",
+        headers={**headers, "If-None-Match": f'W/"unrelated", {etag}'},
+    )
+    assert revalidate.status_code == 304
+    assert revalidate.headers.get("etag") == etag
+
+    update_response = await client.put(
+        f"/api/test_user_123/tasks/{task_id}",
+        headers=headers,
+        json={"title": "Bumped updated_at"},
+    )
+    assert update_response.status_code == 200
+
+    after_write = await client.get(
+        f"/api/test_user_123/tasks/{task_id}",
+        headers={**headers, "If-None-Match": etag},
+    )
+    assert after_write.status_code == 200, "Stale ETag must not revalidate after a write"
+    assert after_write.headers.get("etag") != etag
+    assert after_write.json()["title"] == "Bumped updated_at"